@@ -20,9 +20,180 @@ along with ArcadeMachine-UD. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import json
-from datetime import datetime
+import re
+from datetime import date
+from functools import lru_cache
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj, default=None):
+    """Serializes an object to indented JSON bytes.
+
+    Uses orjson's C-level encoder when the package is available and
+    falls back to the standard library otherwise.
+
+    Args:
+        obj: The object to serialize.
+        default (callable, optional): Projection applied to objects the
+            encoder does not handle natively, letting it walk custom
+            objects without materializing intermediate dictionaries.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=default)
+    return json.dumps(obj, indent=2, default=default).encode("utf-8")
+
+
+def _json_dumps_line(obj, default=None):
+    """Serializes an object to one compact JSON-Lines record.
+
+    The trailing newline is appended by orjson's OPT_APPEND_NEWLINE
+    when available, so the record is produced as a single bytes buffer
+    without a separate concatenation.
+
+    Args:
+        obj: The object to serialize.
+        default (callable, optional): Projection applied to objects the
+            encoder does not handle natively.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document plus a trailing newline.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE, default=default)
+    return (json.dumps(obj, default=default) + "\n").encode("utf-8")
+
+
+def _json_loads(data):
+    """Deserializes a JSON document from bytes or str.
+
+    Uses orjson's C-level parser when the package is available and
+    falls back to the standard library otherwise.
+
+    Args:
+        data (bytes | str): The JSON document to parse.
+
+    Returns:
+        The deserialized Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_cache = {}
+
+
+def _cached_load(path, loader):
+    """Loads a file through the module-level parse cache.
+
+    The cache is keyed on the file path and its st_mtime_ns, so the
+    loader only runs again when the file has actually changed on disk.
+    Results for missing files are never cached.
+
+    Args:
+        path (str): Path of the file backing the loader.
+        loader (callable): Zero-argument function that parses the file.
+
+    Returns:
+        The loader's result, possibly served from the cache.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _cache.pop(path, None)
+        return loader()
+    entry = _cache.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    result = loader()
+    _cache[path] = (mtime, result)
+    return result
+
+
+def _invalidate_cache(path):
+    """Discards the cached parse result for a file path.
+
+    Args:
+        path (str): Path whose cache entry should be dropped.
+
+    Returns:
+        None
+    """
+    _cache.pop(path, None)
+
+
+def invalidate_games_cache():
+    """Discards the cached games list.
+
+    This method must be called whenever 'games.json' or the reviews
+    sidecar is rewritten so that the next call to load_games re-reads
+    them.
+
+    Returns:
+        None
+    """
+    _invalidate_cache("games.json")
+
+
+_PHONE_RE = re.compile(r"\d{1,15}")
+
+
+@lru_cache(maxsize=1024)
+def _name_is_valid(name: str) -> bool:
+    """Checks for a letters-and-spaces name, memoizing repeated inputs.
+
+    Keeps str.isalpha semantics so accented names like "José María"
+    stay valid and all-space names stay invalid.
+    """
+    return name.replace(" ", "").isalpha()
+
+
+@lru_cache(maxsize=1024)
+def _phone_is_valid(phone: str) -> bool:
+    """Runs the compiled phone pattern, memoizing repeated inputs."""
+    return _PHONE_RE.fullmatch(phone) is not None
+
+
+def validate_name(name):
+    """Validates a user's name.
+
+    This method verifies that the name provided is a string containing
+    only letters and spaces, memoizing repeated inputs. Compound names
+    such as "Jose Maria" are considered valid.
+
+    Args:
+        name (str): The name to validate.
+
+    Returns:
+        bool: True if the name is valid, False otherwise.
+    """
+    return isinstance(name, str) and _name_is_valid(name)
+
+
+def validate_phone(phone):
+    """Validates a user's phone number.
+
+    This method verifies that the telephone number provided is a
+    string containing only digits and that its length does not exceed
+    15 characters, using a regular expression compiled once at module
+    import.
+
+    Args:
+        phone (str): The phone number to validate.
+
+    Returns:
+        bool: True if the phone number is valid, False otherwise.
+    """
+    return isinstance(phone, str) and _phone_is_valid(phone)
+
 
 class User:
     """
@@ -34,15 +205,38 @@ class User:
         phone (str): User's phone number.
 
     Methods:
+        from_trusted(user_dict): Builds a user from trusted storage data.
         validate_name(name): Validates the user's name.
         validate_phone(phone): Validates the user's phone number.
     """
 
+    __slots__ = ("id", "name", "phone")
+
     def __init__(self, name, phone):
         self.id = None
         self.name = self.validate_name(name)
         self.phone = self.validate_phone(phone)
 
+    @classmethod
+    def from_trusted(cls, user_dict):
+        """Builds a User from an already-validated dictionary.
+
+        This method bypasses __init__ so that users reloaded from our
+        own storage are not re-validated on every application start.
+        It must only be used with records this application wrote.
+
+        Args:
+            user_dict (dict): Dictionary with the user's id, name and phone.
+
+        Returns:
+            User: The reconstructed user.
+        """
+        user = cls.__new__(cls)
+        user.id = user_dict.get("id")
+        user.name = user_dict["name"]
+        user.phone = user_dict["phone"]
+        return user
+
     def validate_name(self, name):
         """Validates the user's name.
 
@@ -57,7 +251,7 @@ class User:
             str: The name validated if valid; otherwise, returns None and displays an error message.
 
         """
-        if isinstance(name, str) and name.replace(" ", "").isalpha():
+        if validate_name(name):
             return name
         print("Name must be a string containing only letters and spaces.")
         return None
@@ -81,7 +275,7 @@ class User:
             non-numeric characters.
 
         """
-        if isinstance(phone, str) and phone.isdigit() and len(phone) <= 15:
+        if validate_phone(phone):
             return phone
         print("Phone number must be digits only with a maximum of 15 characters.")
         return None
@@ -98,9 +292,10 @@ class Game:
 
     Methods:
         add_review(user_id, review): Adds a review to the game.
-        to_dict(): Converts the game information to a dictionary.
-        save_games(games): Saves the list of games to a JSON file.
     """
+
+    __slots__ = ("game_id", "title", "category", "reviews")
+
     def __init__(self, game_id, title, category, reviews=None):
         self.game_id = game_id
         self.title = title
@@ -123,45 +318,51 @@ class Game:
         """
         self.reviews.append({"user_id": user_id, "review": review})
 
-    def to_dict(self):
-        """Converts game information to a dictionary.
 
-        This method creates and returns a dictionary containing the 
-        game attributes, including the game ID, title, category and 
-        reviews.
+def _game_to_dict(game):
+    """Converts a Game object to a serializable dictionary.
 
-        Returns:
-            dict: A dictionary representing the game information.
-        """
-        return {
-            "game_id": self.game_id,
-            "title": self.title,
-            "category": self.category,
-            "reviews": self.reviews,
-        }
+    Used as the serializer's default= hook so saving games does not
+    materialize an intermediate list of dictionaries first.
 
-    def save_games(self, games):
-        """Saves the list of games in a JSON file.
+    Args:
+        game (Game): The game to convert.
 
-        This method takes a list of game objects and serializes them 
-        in JSON format, saving them in a file named 'games.json'.
-        If an error occurs during the saving process, an error message 
-        is printed.
+    Returns:
+        dict: A dictionary with the game's ID, title, category and reviews.
+    """
+    return {
+        "game_id": game.game_id,
+        "title": game.title,
+        "category": game.category,
+        "reviews": game.reviews,
+    }
 
-        Args:
-            games (list): list of Game objects to be saved.
 
-        Returns:
-            None
-        
-        Raises:
-            IOError: If an error occurs when trying to write to the file.
-        """
-        try:
-            with open("games.json", "w") as file:
-                json.dump([game.to_dict() for game in games], file, indent=4)
-        except Exception as e:
-            print(f"Error saving games: {e}")
+def save_games(games):
+    """Saves the list of games in a JSON file.
+
+    This method takes a list of game objects and serializes them
+    in JSON format, saving them in a file named 'games.json'.
+    It was previously an instance method on Game even though it never
+    used the instance. If an error occurs during the saving process,
+    an error message is printed.
+
+    Args:
+        games (list): list of Game objects to be saved.
+
+    Returns:
+        None
+
+    Raises:
+        IOError: If an error occurs when trying to write to the file.
+    """
+    try:
+        with open("games.json", "wb") as file:
+            file.write(_json_dumps(games, default=_game_to_dict))
+        invalidate_games_cache()
+    except Exception as e:
+        print(f"Error saving games: {e}")
 
 
 class ArcadeMachine:
@@ -225,6 +426,7 @@ class ArcadeMachine:
             )
             return
 
+        game_titles = [game.title for game in self.games]
         purchase = {
             "user_id": user_id,
             "address": address,
@@ -232,21 +434,61 @@ class ArcadeMachine:
                 "material": self.material,
                 "color": self.color,
                 "player_count": self.player_count,
-                "games": [game.title for game in self.games],
+                "games": game_titles,
+                "games_str": ", ".join(game_titles),
             },
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": date.today().isoformat(),
         }
         save_purchases(purchase)
         print(f"Purchase finalized for user {user_id}.")
 
 
+def _user_to_dict(user):
+    """Converts a User object to a serializable dictionary.
+
+    Needed because User defines __slots__ and therefore has no
+    __dict__ to hand to the serializer.
+
+    Args:
+        user (User): The user to convert.
+
+    Returns:
+        dict: A dictionary with the user's id, name and phone.
+    """
+    return {"id": user.id, "name": user.name, "phone": user.phone}
+
+
+def _migrate_legacy_users():
+    """Converts a legacy 'users.json' array file to JSON Lines.
+
+    This one-shot migration reads the old whole-file JSON array,
+    appends each user as one line to 'users.jsonl' and removes the
+    legacy file. It does nothing when no legacy file is present.
+
+    Returns:
+        None
+    """
+    if not os.path.exists("users.json"):
+        return
+    try:
+        with open("users.json", "rb") as file:
+            legacy = _json_loads(file.read())
+        with open("users.jsonl", "ab") as file:
+            for user in legacy:
+                file.write(_json_dumps_line(user))
+        os.remove("users.json")
+    except Exception as e:
+        print(f"Error migrating users: {e}")
+
+
 def save_users(users):
-    """Saves the list of users in a JSON file.
+    """Saves the full list of users in the users JSON-Lines file.
 
-    This method takes a list of user objects and serializes them 
-    in JSON format, saving them in a file named 'users.json'.
-    If an error occurs during the saving process, an error message 
-    is printed.
+    This method takes a list of user objects and rewrites
+    'users.jsonl' with one line per user. It is only needed for bulk
+    migrations; appending a single new user should go through
+    append_user instead. If an error occurs during the saving process,
+    an error message is printed.
 
     Args:
         users (list): list of User objects to be saved.
@@ -258,22 +500,24 @@ def save_users(users):
         IOError: If an error occurs when trying to write to the file.
     """
     try:
-        with open("users.json", "w") as file:
-            json.dump([user.__dict__ for user in users], file, indent=2)
+        with open("users.jsonl", "wb") as file:
+            for user in users:
+                file.write(_json_dumps_line(user, default=_user_to_dict))
+        _invalidate_cache("users.jsonl")
     except Exception as e:
         print(f"Error saving users: {e}")
 
 
-def save_purchases(purchase):
-    """Stores a purchase in the purchases JSON file.
+def append_user(user):
+    """Appends a single user to the users JSON-Lines file.
 
-    This method takes a dictionary representing a purchase and adds 
-    it to the 'purchases.json' file. If the file does not exist or is
-    empty, a new list of purchases is created. If an error occurs
-    occurs during the saving process, an error message is printed.
+    This method serializes one User object and appends it as a single
+    line to 'users.jsonl', so creating a user does not rewrite every
+    previously stored user. If an error occurs during the saving
+    process, an error message is printed.
 
     Args:
-        purchase (dict): dictionary representing a purchase.
+        user (User): the User object to append.
 
     Returns:
         None
@@ -282,44 +526,138 @@ def save_purchases(purchase):
         IOError: If an error occurs when trying to write to the file.
     """
     try:
-        if os.path.exists("purchases.json") and os.path.getsize("purchases.json") > 0:
-            with open("purchases.json", "r") as file:
-                purchases = json.load(file)
-        else:
-            purchases = []
+        _migrate_legacy_users()
+        with open("users.jsonl", "ab") as file:
+            file.write(_json_dumps_line(user, default=_user_to_dict))
+        _invalidate_cache("users.jsonl")
+    except Exception as e:
+        print(f"Error saving user: {e}")
+
+
+def _migrate_legacy_purchases():
+    """Converts a legacy 'purchases.json' array file to JSON Lines.
 
-        purchases.append(purchase)
+    This one-shot migration reads the old whole-file JSON array,
+    appends each purchase as one line to 'purchases.jsonl' and removes
+    the legacy file. It does nothing when no legacy file is present.
 
-        with open("purchases.json", "w") as file:
-            json.dump(purchases, file, indent=4)
+    Returns:
+        None
+    """
+    if not os.path.exists("purchases.json"):
+        return
+    try:
+        with open("purchases.json", "rb") as file:
+            legacy = _json_loads(file.read())
+        with open("purchases.jsonl", "ab") as file:
+            for purchase in legacy:
+                file.write(_json_dumps_line(purchase))
+        os.remove("purchases.json")
+    except Exception as e:
+        print(f"Error migrating purchases: {e}")
+
+
+def save_purchases(purchase):
+    """Appends a purchase to the purchases JSON-Lines file.
+
+    This method takes a dictionary representing a purchase and appends
+    it as a single line to 'purchases.jsonl', so each save writes only
+    the new record instead of rewriting every stored purchase. If an
+    error occurs during the saving process, an error message is printed.
+
+    Args:
+        purchase (dict): dictionary representing a purchase.
+
+    Returns:
+        None
+
+    Raises:
+        IOError: If an error occurs when trying to write to the file.
+    """
+    try:
+        _migrate_legacy_purchases()
+        with open("purchases.jsonl", "ab") as file:
+            file.write(_json_dumps_line(purchase))
+        _invalidate_cache("purchases.jsonl")
     except Exception as e:
         print(f"Error saving purchase: {e}")
 
 
 def load_users():
-    """Loads the list of users from a JSON file.
+    """Loads the list of users from the users JSON-Lines file.
 
-    This method attempts to read the file 'users.json' and deserializes 
-    its contents into a list of User objects. If the file does not exist,
-    an empty list is returned.
+    This method migrates any legacy 'users.json' file, then reads
+    'users.jsonl' line by line and deserializes each line into a User
+    object. If the file does not exist, an empty list is returned.
 
     Returns:
         list: List of User objects loaded from the file. If the
         file does not exist, an empty list is returned.
 
     Raises:
-        FileNotFoundError: If the file 'users.json' is not found.
         Exception: If an error occurs when trying to read or deserialize the file.
     """
+    _migrate_legacy_users()
+    return _cached_load("users.jsonl", _load_users_from_disk)
+
+
+def _load_users_from_disk():
+    """Reads and parses 'users.jsonl' without consulting the cache.
+
+    Returns:
+        list: List of User objects, or an empty list if the file does
+        not exist.
+    """
     try:
-        with open("users.json", "r") as file:
-            user_dicts = json.load(file)
-            users = [
-                User(user_dict["name"], user_dict["phone"]) for user_dict in user_dicts
-            ]
-            for i, user in enumerate(users):
+        with open("users.jsonl", "rb") as file:
+            user_dicts = [_json_loads(line) for line in file if line.strip()]
+        users = [User.from_trusted(user_dict) for user_dict in user_dicts]
+        for i, user in enumerate(users):
+            if user.id is None:
                 user.id = i + 1
-            return users
+        return users
+    except FileNotFoundError:
+        return []
+
+
+def append_review(game_id, user_id, review):
+    """Appends a single review to the reviews JSON-Lines sidecar file.
+
+    This method records one review as a single line in 'reviews.jsonl'
+    instead of rewriting the whole games file per review. The reviews
+    stored here are merged back into each game by load_games. If an
+    error occurs during the saving process, an error message is printed.
+
+    Args:
+        game_id (str): The ID of the game being reviewed.
+        user_id (str): The ID of the user leaving the review.
+        review (str): The content of the review.
+
+    Returns:
+        None
+
+    Raises:
+        IOError: If an error occurs when trying to write to the file.
+    """
+    try:
+        record = {"game_id": game_id, "user_id": user_id, "review": review}
+        with open("reviews.jsonl", "ab") as file:
+            file.write(_json_dumps_line(record))
+        invalidate_games_cache()
+    except Exception as e:
+        print(f"Error saving review: {e}")
+
+
+def _load_sidecar_reviews():
+    """Loads the reviews stored in the JSON-Lines sidecar file.
+
+    Returns:
+        list: List of review dictionaries loaded from 'reviews.jsonl'.
+        If the file does not exist, an empty list is returned.
+    """
+    try:
+        with open("reviews.jsonl", "rb") as file:
+            return [_json_loads(line) for line in file if line.strip()]
     except FileNotFoundError:
         return []
 
@@ -327,9 +665,13 @@ def load_users():
 def load_games():
     """Loads the list of games from a JSON file.
 
-    This method attempts to read the file 'games.json' and deserializes 
-    its contents into a list of Game objects. If the file does not exist
-    or is empty, an empty list is returned.
+    This method attempts to read the file 'games.json' and deserializes
+    its contents into a list of Game objects, then merges in any
+    reviews recorded in the 'reviews.jsonl' sidecar file. The parsed
+    list is cached at module scope keyed on the file's mtime, so
+    repeated calls within a session do not re-read an unchanged file;
+    writers additionally invalidate via invalidate_games_cache. If the
+    file does not exist or is empty, an empty list is returned.
 
     Returns:
         list: List of Game objects loaded from the file. If the
@@ -339,10 +681,20 @@ def load_games():
         FileNotFoundError: If the file 'games.json' is not found.
         Exception: If an error occurs when trying to read or deserialize the file.
     """
+    return _cached_load("games.json", _load_games_from_disk)
+
+
+def _load_games_from_disk():
+    """Reads and parses 'games.json' without consulting the cache.
+
+    Returns:
+        list: List of Game objects with sidecar reviews merged in, or
+        an empty list if the file is missing or unreadable.
+    """
     try:
-        with open("games.json", "r") as file:
-            games_data = json.load(file)
-            return [
+        with open("games.json", "rb") as file:
+            games_data = _json_loads(file.read())
+            games = [
                 Game(
                     game["game_id"],
                     game["title"],
@@ -351,6 +703,12 @@ def load_games():
                 )
                 for game in games_data
             ]
+            games_by_id = {game.game_id: game for game in games}
+            for record in _load_sidecar_reviews():
+                game = games_by_id.get(record["game_id"])
+                if game:
+                    game.add_review(record["user_id"], record["review"])
+            return games
     except FileNotFoundError:
         print("games.json file not found. No games loaded.")
         return []
@@ -359,24 +717,61 @@ def load_games():
         return []
 
 
+def load_user_purchases(user_id):
+    """Streams the purchases made by a specific user.
+
+    This method migrates any legacy 'purchases.json' file, then reads
+    'purchases.jsonl' line by line, yielding only the purchases whose
+    user_id matches. Because records are filtered while streaming, the
+    full purchase history is never materialized in memory.
+
+    Args:
+        user_id (str): The ID of the user whose purchases are wanted.
+
+    Yields:
+        dict: Each purchase made by the given user, in file order.
+    """
+    _migrate_legacy_purchases()
+    try:
+        with open("purchases.jsonl", "rb") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                purchase = _json_loads(line)
+                if purchase["user_id"] == user_id:
+                    yield purchase
+    except FileNotFoundError:
+        return
+
+
 def load_purchases():
-    """Loads the shopping list from a JSON file.
+    """Loads the shopping list from the purchases JSON-Lines file.
 
-    This method attempts to read the file 'purchases.json' and deserializes 
-    its contents into a list of dictionaries representing purchases. 
-    If the file does not exist, an empty list is returned.
+    This method migrates any legacy 'purchases.json' file, then reads
+    'purchases.jsonl' line by line, deserializing each line into a
+    dictionary representing a purchase. If the file does not exist, an
+    empty list is returned.
 
     Returns:
         list: List of dictionaries representing purchases loaded from the file.
         If the file does not exist, returns an empty list.
 
     Raises:
-        FileNotFoundError: If the file 'purchases.json' is not found.
         Exception: If an error occurs when trying to read or deserialize the file.
     """
+    _migrate_legacy_purchases()
+    return _cached_load("purchases.jsonl", _load_purchases_from_disk)
+
+
+def _load_purchases_from_disk():
+    """Reads and parses 'purchases.jsonl' without consulting the cache.
+
+    Returns:
+        list: List of purchase dictionaries, or an empty list if the
+        file does not exist.
+    """
     try:
-        with open("purchases.json", "r") as file:
-            purchases = json.load(file)
-            return purchases
+        with open("purchases.jsonl", "rb") as file:
+            return [_json_loads(line) for line in file if line.strip()]
     except FileNotFoundError:
         return []
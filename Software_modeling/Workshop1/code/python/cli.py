@@ -17,68 +17,34 @@ You should have received a copy of the GNU General Public License
 along with ArcadeMachine-UD. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import sys
+
 from arcade_machine import (
     User,
     ArcadeMachine,
     Game,
     load_users,
     load_games,
-    save_users,
-    load_purchases,
+    append_user,
+    append_review,
+    load_user_purchases,
+    validate_name,
+    validate_phone,
 )
 
 
-def validate_name(name):
-    """Validates the user's name.
-
-    This method verifies that the name provided is a string
-    containing only letters and spaces. Compound names such
-    as “Jose Maria” are considered valid.
-
-    Args:
-        name (str): The name to validate.
-
-    Returns:
-        str: The name validated if valid; otherwise, returns
-        None and displays an error message.
-
-    Raises:
-        ValueError: If the name is not a string or contains non-alphabetic characters.
-    """
-    return isinstance(name, str) and name.replace(" ", "").isalpha()
-
-
-def validate_phone(phone):
-    """Validates the user's phone number.
-
-    This method verifies that the telephone number provided is a
-    string containing only digits and that its length does not
-    exceed 15 characters.
-
-    Args:
-        phone (str): The phone number to validate.
-
-    Returns:
-        str: The validated phone number if valid; otherwise,
-        returns None and displays an error message.
-
-    Raises:
-        ValueError: If the phone number is not a string or contains
-        non-numeric characters.
-    """
-    return isinstance(phone, str) and phone.isdigit() and len(phone) <= 15
-
-
-def create_user(users):
+def create_user(users, users_by_id):
     """Creates users and saves them in a JSON file.
 
     This method takes a list of User objects, creates the users
     and saves them in the file 'users.json'. If a user already exists,
-    it is skipped and continues with the next user. If an
+    it is skipped and continues with the next user. The ID index is
+    refreshed with the new user so later lookups stay O(1). If an
     error occurs during the saving process, an error message is printed.
 
     Args:
         users (list): list of User objects to be created.
+        users_by_id (dict): index of User objects keyed by their ID.
 
     Returns:
         None
@@ -107,18 +73,22 @@ def create_user(users):
     user = User(name, phone)
     user.id = len(users) + 1
     users.append(user)
+    users_by_id[user.id] = user
     print(f"User created with ID: {user.id}")
-    save_users(users)
+    append_user(user)
 
 
-def show_available_games():
+def show_available_games(users_by_id):
     """Displays available games and allows users to leave reviews.
 
     This method loads the list of games from the 'games.json' file,
-    displays the details of each available game, and allows users to 
-    leave reviews for the selected games. If there are no games available, 
+    displays the details of each available game, and allows users to
+    leave reviews for the selected games. If there are no games available,
     the user is informed.
 
+    Args:
+        users_by_id (dict): index of User objects keyed by their ID.
+
     Returns:
         None
 
@@ -126,37 +96,42 @@ def show_available_games():
         Exception: if an error occurs when loading the games from the archive.
     """
     games = load_games()
-    print("Available games:")
+    lines = ["Available games:"]
     if games:
         for game in games:
-            print(f"- Code: {game.game_id}, Title: {game.title} ({game.category})")
+            lines.append(f"- Code: {game.game_id}, Title: {game.title} ({game.category})")
             if game.reviews:
-                print("   Reviews:")
+                lines.append("   Reviews:")
                 for review in game.reviews:
-                    print(f"   - {review['review']} (User ID: {review['user_id']})")
+                    lines.append(f"   - {review['review']} (User ID: {review['user_id']})")
             else:
-                print("   No reviews available.")
-            print("---")
+                lines.append("   No reviews available.")
+            lines.append("---")
     else:
-        print("No games available.")
+        lines.append("No games available.")
+    sys.stdout.write("\n".join(lines) + "\n")
 
+    games_by_id = {game.game_id: game for game in games}
     while True:
-        users = load_users()
         leave_review = input("Do you want to leave a review? (yes/no): ")
         if leave_review.lower() == "yes":
             user_id = input("Enter your user ID: ")
 
-            if not any(user.id == int(user_id) for user in users):
+            try:
+                uid = int(user_id)
+            except ValueError:
+                uid = None
+            if uid not in users_by_id:
                 print("Invalid user ID. Please try again.")
                 continue
 
             game_code = input("Enter the code of the game to review: ")
 
-            game = next((g for g in games if g.game_id == game_code), None)
+            game = games_by_id.get(game_code)
             if game:
                 review = input("Enter your review: ")
                 game.add_review(user_id, review)
-                game.save_games(games)
+                append_review(game.game_id, user_id, review)
                 print("Review added successfully!")
             else:
                 print("Invalid game code. Please try again.")
@@ -166,16 +141,16 @@ def show_available_games():
             print("Invalid option. Please enter 'yes' or 'no'.")
 
 
-def finalize_purchase(users):
+def finalize_purchase(users_by_id):
     """Finalize the purchase of the arcade machine.
 
     This method allows a user to finalize the purchase of an arcade machine,
-    including the user's details and delivery address. Verifies that at 
-    least one game has been added to the machine before allowing the purchase 
+    including the user's details and delivery address. Verifies that at
+    least one game has been added to the machine before allowing the purchase
     to be finalized.
 
     Args:
-        users (list): list of User objects representing users.
+        users_by_id (dict): index of User objects keyed by their ID.
 
     Returns:
         None
@@ -186,7 +161,11 @@ def finalize_purchase(users):
     """
     user_id = input("Enter your user ID: ")
 
-    if not any(user.id == int(user_id) for user in users):
+    try:
+        uid = int(user_id)
+    except ValueError:
+        uid = None
+    if uid not in users_by_id:
         print("User ID does not exist. Please try again.")
         return
 
@@ -214,6 +193,7 @@ def finalize_purchase(users):
 
     machine = ArcadeMachine(material, color, player_count)
 
+    games_by_id = {game.game_id: game for game in load_games()}
     while True:
         game_code = input(
             "Enter the code of the game to add (or type 'done' to finish): "
@@ -221,8 +201,7 @@ def finalize_purchase(users):
         if game_code.lower() == "done":
             break
 
-        games = load_games()
-        game = next((g for g in games if g.game_id == game_code), None)
+        game = games_by_id.get(game_code)
         if game:
             machine.add_game(Game(game.game_id, game.title, game.category))
             print(f"Added {game.title} to the machine.")
@@ -246,19 +225,24 @@ def show_user_purchases():
         Exception: if an error occurs when loading purchases from file.
     """
     user_id = input("Enter your user ID to view your purchases: ")
-    purchases = load_purchases()
-    user_purchases = [p for p in purchases if p["user_id"] == user_id]
+    user_purchases = list(load_user_purchases(user_id))
 
     if user_purchases:
+        lines = []
         for purchase in user_purchases:
-            print(f"Purchase ID: {purchase['user_id']}")
-            print(f"Address: {purchase['address']}")
-            print(f"Machine Material: {purchase['machine']['material']}")
-            print(f"Machine Color: {purchase['machine']['color']}")
-            print(f"Machine Player Count: {purchase['machine']['player_count']}")
-            print(f"Machine Games: {', '.join(purchase['machine']['games'])}")
-            print(f"Date: {purchase['date']}")
-            print("---")
+            machine_info = purchase["machine"]
+            games_str = machine_info.get("games_str") or ", ".join(
+                machine_info["games"]
+            )
+            lines.append(f"Purchase ID: {purchase['user_id']}")
+            lines.append(f"Address: {purchase['address']}")
+            lines.append(f"Machine Material: {machine_info['material']}")
+            lines.append(f"Machine Color: {machine_info['color']}")
+            lines.append(f"Machine Player Count: {machine_info['player_count']}")
+            lines.append(f"Machine Games: {games_str}")
+            lines.append(f"Date: {purchase['date']}")
+            lines.append("---")
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         print(f"No purchases found for user with ID {user_id}.")
 
@@ -279,6 +263,7 @@ def main():
         Exception: If an error occurs in the execution of any of the menu operations.
     """
     users = load_users()
+    users_by_id = {user.id: user for user in users}
 
     print("Welcome to the Arcade Machine Catalog!")
 
@@ -292,11 +277,11 @@ def main():
 
         choice = input("Select an option (1-5): ")
         if choice == "1":
-            create_user(users)
+            create_user(users, users_by_id)
         elif choice == "2":
-            show_available_games()
+            show_available_games(users_by_id)
         elif choice == "3":
-            finalize_purchase(users)
+            finalize_purchase(users_by_id)
         elif choice == "4":
             show_user_purchases()
         elif choice == "5":
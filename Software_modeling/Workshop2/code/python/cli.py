@@ -1,251 +1,727 @@
-"""
-This module provides a simple command-line interface (CLI) for managing an arcade machine system.
-
-This file is part of ArcadeMachine-UD.
-
-ArcadeMachine-UD is free software: you can redistribute it and/or 
-modify it under the terms of the GNU General Public License as 
-published by the Free Software Foundation, either version 3 of 
-the License, or (at your option) any later version.
-
-ArcadeMachine-UD is distributed in the hope that it will be useful, 
-but WITHOUT ANY WARRANTY; without even the implied warranty of 
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU 
-General Public License for more details.
-
-You should have received a copy of the GNU General Public License 
-along with ArcadeMachine-UD. If not, see <https://www.gnu.org/licenses/>.
-"""
-
-import json
-from datetime import datetime
-from user import User
-from game import Game
-from machine import Machine
-
-
-def create_user(users):
-    """
-    Create a new user and save it to the users list and JSON file.
-
-    Args:
-        users (list): The list of existing users.
-
-    Prompts the user for their name and phone number, assigns a unique ID,
-    and appends the new user to the list. The updated list is saved to
-    'users.json'.
-    """
-    name = input("Enter your name: ")
-    phone = input("Enter your phone number: ")
-
-    user_id = max([user["id"] for user in users], default=0) + 1
-    new_user = User(name, phone)
-    new_user.id = user_id
-
-    users.append({"id": new_user.id, "name": new_user.name, "phone": new_user.phone})
-
-    with open("users.json", "w") as file:
-        json.dump(users, file, indent=4)
-
-    print(f"User created with ID: {new_user.id}")
-
-
-def show_games():
-    """
-    Display all available games.
-
-    Loads games from the Game class and prints their details.
-    If no games are available, informs the user.
-    """
-    games = Game.load_games()
-    if games:
-        for game in games:
-            print(
-                f"ID: {game['game_id']}, Title: {game['title']}, Price: ${game['price']}"
-            )
-    else:
-        print("No games available.")
-
-
-def show_machines():
-    """
-    Display all available arcade machines.
-
-    Loads machines from the Machine class and prints their details.
-    If no machines are available, informs the user.
-    """
-    machines = Machine.load_machines()
-    if machines:
-        for machine in machines:
-            print(
-                f"ID: {machine['machine_id']}, Type: {machine['type']}, Material: {machine['material']}, Color: {machine['color']}, Player Count: {machine['player_count']}"
-            )
-            print(
-                f"Dimensions: {machine['dimensions']}, Weight: {machine['weight']} kg, Power Consumption: {machine['power_consumption']} W"
-            )
-            print(
-                f"Processor: {machine['processor']}, Memory: {machine['memory']}, Base Price: ${machine['base_price']}"
-            )
-            print("---")
-    else:
-        print("No machines available.")
-
-
-def buy_machine(users):
-    """
-    Facilitate the purchase of an arcade machine by a user.
-
-    Args:
-        users (list): The list of existing users.
-
-    Prompts the user for their ID, address, and machine code. Allows them to modify
-    machine properties such as material and player count. Computes total price,
-    saves purchase details to 'purchases.json', and confirms purchase.
-    """
-    user_id = int(input("Enter your user ID: "))
-
-    if not any(user["id"] == user_id for user in users):
-        print("User ID not found.")
-        return
-
-    address = input("Enter your address: ")
-
-    machine_code = input("Enter the machine code you want to buy: ")
-
-    machines = Machine.load_machines()
-    machine = next((m for m in machines if m["machine_id"] == machine_code), None)
-
-    if not machine:
-        print("Machine code not found.")
-        return
-
-    material_change = (
-        input("Do you want to change the material? (yes/no): ").lower() == "yes"
-    )
-
-    if material_change:
-        new_material = input("Enter new material (wood/aluminum/carbon fiber): ")
-        machine["material"] = new_material
-
-    player_count = int(
-        input(
-            "Enter number of players (current is {}): ".format(machine["player_count"])
-        )
-    )
-    machine["player_count"] = player_count
-
-    color = input("Enter color (current is {}): ".format(machine["color"]))
-    machine["color"] = color
-
-    games_to_add = []
-    while True:
-        game_code = input("Enter game code to add (or type 'done' to finish): ")
-        if game_code.lower() == "done":
-            break
-
-        games = Game.load_games()
-        game = next((g for g in games if g["game_id"] == game_code), None)
-
-        if game:
-            games_to_add.append(game)
-            print(f"Added game: {game['title']}")
-        else:
-            print("Game code not found.")
-
-    total_price = machine["base_price"]
-    for game in games_to_add:
-        total_price += game["price"]
-
-    purchase_summary = {
-        "user_id": user_id,
-        "address": address,
-        "machine_code": machine_code,
-        "material": machine["material"],
-        "color": machine["color"],
-        "player_count": player_count,
-        "total_price": total_price,
-        "games_added": [game["title"] for game in games_to_add],
-        "purchase_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    }
-
-    try:
-        with open("purchases.json", "r") as file:
-            purchases = json.load(file)
-            if not isinstance(purchases, list):
-                raise ValueError("Invalid JSON format. Expected a list.")
-    except (FileNotFoundError, ValueError):
-        purchases = []
-
-    purchases.append(purchase_summary)
-
-    with open("purchases.json", "w") as file:
-        json.dump(purchases, file, indent=4)
-
-    print(f"Purchase completed. Summary: {purchase_summary}")
-
-
-def view_purchases(user_id):
-    """
-   View all purchases made by a specific user.
-
-   Args:
-       user_id (int): The ID of the user whose purchases are to be viewed.
-
-   Loads purchases from 'purchases.json' and displays them. If no purchases are found,
-   informs the user.
-   """
-    try:
-        with open("purchases.json", "r") as file:
-            purchases = json.load(file)
-
-        user_purchases = [p for p in purchases if p.get("user_id") == user_id]
-
-        if user_purchases:
-            for purchase in user_purchases:
-                print(purchase)
-        else:
-            print("No purchases found for this ID.")
-
-    except FileNotFoundError:
-        print("No purchases have been made yet.")
-
-
-def main():
-    """
-   Main function that runs the command-line interface for managing arcade machines.
-
-   Loads existing users from 'users.json' and presents options to create users,
-   show games/machines, buy machines, or view purchases. Runs until exit is chosen.
-   """
-    try:
-        with open("users.json", "r") as file:
-            users = json.load(file)
-
-        while True:
-            print(
-                "\n1. Create User\n2. Show Games\n3. Show Machines\n4. Buy Machine\n5. View Purchases\n6. Exit"
-            )
-            choice = int(input("Choose an option: "))
-
-            if choice == 1:
-                create_user(users)
-            elif choice == 2:
-                show_games()
-            elif choice == 3:
-                show_machines()
-            elif choice == 4:
-                buy_machine(users)
-            elif choice == 5:
-                user_id = int(input("Enter your user ID to view purchases: "))
-                view_purchases(user_id)
-            elif choice == 6:
-                break
-            else:
-                print("Invalid option. Please try again.")
-
-    except FileNotFoundError as e:
-        print(f"Error loading files: {e}")
-
-
-if __name__ == "__main__":
-    main()
+"""
+This module provides a simple command-line interface (CLI) for managing an arcade machine system.
+
+This file is part of ArcadeMachine-UD.
+
+ArcadeMachine-UD is free software: you can redistribute it and/or 
+modify it under the terms of the GNU General Public License as 
+published by the Free Software Foundation, either version 3 of 
+the License, or (at your option) any later version.
+
+ArcadeMachine-UD is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU 
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License 
+along with ArcadeMachine-UD. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import shlex
+import sys
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from user import User
+from game import Game, set_pretty_output
+from machine import Machine
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_BUFFER_SIZE = 65536
+
+
+def _dumps_line(record):
+    """
+    Serialize one record to a compact JSON line (bytes with newline).
+
+    Uses orjson's C encoder when available, falling back to the
+    standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def _loads(data):
+    """Parse JSON bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class PurchaseWriter:
+    """
+    Batches purchase records and appends them to a JSON-Lines file.
+
+    Records handed to submit() are placed on an in-process queue and
+    written by a background thread, which drains every queued record
+    and appends the whole batch with a single write call. This keeps
+    the file write off the critical path of each purchase while
+    amortizing serialization and syscall cost across the batch. A
+    final flush is registered with atexit so queued purchases are
+    written before the process exits.
+    """
+
+    def __init__(self, path, max_batch=64):
+        self._path = path
+        self._max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, record):
+        """
+        Queue one purchase record for writing.
+
+        Args:
+            record (dict): The purchase record to persist.
+        """
+        self._queue.put(record)
+
+    def flush(self):
+        """
+        Block until every record submitted so far is on disk.
+
+        Enqueues a sentinel event and waits for the background thread
+        to signal it. Because the queue is FIFO, the sentinel is only
+        reached after all earlier records — including a batch the
+        thread had already popped when flush was called — have been
+        written, so readers and the atexit handler never race an
+        in-flight batch.
+        """
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def _drain(self):
+        """
+        Background loop: collect queued records into batches and write them.
+
+        Flush sentinels picked up along the way are signalled only
+        after the records ahead of them have been written; the finally
+        guarantees waiting flushers wake up even if the write fails.
+        """
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self._max_batch:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            sentinels = [i for i in items if isinstance(i, threading.Event)]
+            batch = [i for i in items if not isinstance(i, threading.Event)]
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except Exception as e:
+                print(f"Error writing purchases: {e}")
+            finally:
+                for sentinel in sentinels:
+                    sentinel.set()
+
+    def _write_batch(self, batch):
+        """
+        Append a batch of records to the file with one write call.
+
+        Args:
+            batch (list): Records to serialize and append.
+        """
+        data = b"".join(_dumps_line(record) for record in batch)
+        with self._write_lock:
+            with open(self._path, "ab", buffering=_BUFFER_SIZE) as file:
+                file.write(data)
+
+
+_purchase_writer = None
+
+_PURCHASE_INDEX_PATH = "purchases_by_user.json"
+_purchase_index = None  # (indexed_size, {user_id_str: [byte_offsets]})
+
+
+def _load_purchase_index():
+    """
+    Load the per-user purchase offset index, caching it in memory.
+
+    Returns:
+        tuple: The file size the index covers and the mapping of
+        user ID (as a string) to byte offsets in 'purchases.jsonl'.
+    """
+    global _purchase_index
+    if _purchase_index is None:
+        try:
+            with open(_PURCHASE_INDEX_PATH, "rb") as file:
+                data = _loads(file.read())
+            _purchase_index = (data.get("size", 0), data.get("offsets", {}))
+        except (FileNotFoundError, ValueError):
+            _purchase_index = (0, {})
+    return _purchase_index
+
+
+def _save_purchase_index(size, offsets):
+    """
+    Persist the purchase offset index atomically.
+
+    Args:
+        size (int): Size of 'purchases.jsonl' the index covers.
+        offsets (dict): Mapping of user ID string to byte offsets.
+    """
+    global _purchase_index
+    _purchase_index = (size, offsets)
+    tmp_path = _PURCHASE_INDEX_PATH + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(_dumps_line({"size": size, "offsets": offsets}))
+    os.replace(tmp_path, _PURCHASE_INDEX_PATH)
+
+
+def _sync_purchase_index():
+    """
+    Bring the offset index up to date with 'purchases.jsonl'.
+
+    Only the tail of the file appended since the last sync is
+    scanned, so the cost is proportional to new purchases rather
+    than the whole history. Because purchases are appended by the
+    background writer in batches, the index is refreshed here at
+    read time instead of on every insert.
+
+    Returns:
+        dict: Mapping of user ID string to byte offsets.
+    """
+    size, offsets = _load_purchase_index()
+    try:
+        file_size = os.path.getsize("purchases.jsonl")
+    except OSError:
+        return {}
+    if file_size == size:
+        return offsets
+    if file_size < size:
+        # The data file was rewritten; rebuild from scratch.
+        size, offsets = 0, {}
+    with open("purchases.jsonl", "rb", buffering=_BUFFER_SIZE) as file:
+        file.seek(size)
+        offset = size
+        for line in file:
+            if line.strip():
+                record = _loads(line)
+                offsets.setdefault(str(record.get("user_id")), []).append(offset)
+            offset += len(line)
+    _save_purchase_index(file_size, offsets)
+    return offsets
+
+
+def _get_purchase_writer():
+    """
+    Return the shared PurchaseWriter, creating it on first use.
+
+    Returns:
+        PurchaseWriter: The process-wide purchase writer singleton.
+    """
+    global _purchase_writer
+    if _purchase_writer is None:
+        _purchase_writer = PurchaseWriter("purchases.jsonl")
+    return _purchase_writer
+
+
+def _migrate_legacy_list(json_path, jsonl_path):
+    """
+    Convert a legacy whole-file JSON array to a JSON-Lines file.
+
+    Args:
+        json_path (str): Path of the legacy JSON array file.
+        jsonl_path (str): Path of the JSON-Lines file to append to.
+
+    Reads the legacy array, appends each record as one line to the
+    JSON-Lines file and removes the legacy file. Does nothing when the
+    legacy file is not present.
+    """
+    if not os.path.exists(json_path):
+        return
+    try:
+        with open(json_path, "rb") as file:
+            legacy = _loads(file.read())
+        with open(jsonl_path, "ab", buffering=_BUFFER_SIZE) as file:
+            for record in legacy:
+                file.write(_dumps_line(record))
+        os.remove(json_path)
+    except (ValueError, OSError) as e:
+        print(f"Error migrating {json_path}: {e}")
+
+
+def _append_record(jsonl_path, record):
+    """
+    Append one record as a single line to a JSON-Lines file.
+
+    Args:
+        jsonl_path (str): Path of the JSON-Lines file.
+        record (dict): The record to serialize and append.
+    """
+    with open(jsonl_path, "ab", buffering=_BUFFER_SIZE) as file:
+        file.write(_dumps_line(record))
+
+
+def _load_records(jsonl_path):
+    """
+    Load all records from a JSON-Lines file.
+
+    Args:
+        jsonl_path (str): Path of the JSON-Lines file.
+
+    Returns:
+        list: One dict per non-empty line, or an empty list when the
+        file does not exist.
+    """
+    try:
+        with open(jsonl_path, "rb", buffering=_BUFFER_SIZE) as file:
+            return [_loads(line) for line in file if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(sec):
+    """
+    Format a second-resolution epoch timestamp as 'YYYY-MM-DD HH:MM:SS'.
+
+    Args:
+        sec (int): Whole seconds since the epoch.
+
+    Returns:
+        str: The formatted local timestamp. Memoized on the truncated
+        second, so any number of purchases stamped within the same
+        wall-clock second format the string only once.
+    """
+    return datetime.fromtimestamp(sec).isoformat(sep=" ", timespec="seconds")
+
+
+def _read_int(prompt):
+    """
+    Prompt until the user enters a valid integer.
+
+    Args:
+        prompt (str): The prompt to display.
+
+    Returns:
+        int: The parsed value. Invalid entries are reported and the
+        prompt repeats, so a typo never raises ValueError into the
+        caller.
+    """
+    while True:
+        try:
+            return int(input(prompt))
+        except ValueError:
+            print("Please enter a number.")
+
+
+def create_user(users, users_by_id):
+    """
+    Create a new user and save it to the users list and JSON file.
+
+    Args:
+        users (list): The list of existing users.
+        users_by_id (dict): Index of user records keyed by their ID.
+
+    Prompts the user for their name and phone number, assigns a unique ID,
+    and appends the new user to the list and the ID index. The updated
+    list is saved to 'users.json'.
+    """
+    name = input("Enter your name: ")
+    phone = input("Enter your phone number: ")
+
+    try:
+        record = _create_user_record(users, users_by_id, name, phone)
+    except ValueError as e:
+        print(e)
+        return
+    _append_record("users.jsonl", record)
+
+    print(f"User created with ID: {record['id']}")
+
+
+def _create_user_record(users, users_by_id, name, phone):
+    """
+    Build a new user record and register it in the in-memory state.
+
+    Args:
+        users (list): The list of existing users.
+        users_by_id (dict): Index of user records keyed by their ID.
+        name (str): The new user's name.
+        phone (str): The new user's phone number.
+
+    Returns:
+        dict: The new user record. The caller decides when to write
+        it to disk, so script mode can batch many users into one
+        append.
+
+    Raises:
+        ValueError: If the name or phone number is invalid.
+    """
+    user_id = max(users_by_id, default=0) + 1
+    new_user = User(name, phone)
+    new_user.id = user_id
+
+    record = {"id": new_user.id, "name": new_user.name, "phone": new_user.phone}
+    users.append(record)
+    users_by_id[new_user.id] = record
+    return record
+
+
+def show_games():
+    """
+    Display all available games.
+
+    Loads games from the Game class and prints their details with a
+    single buffered write. If no games are available, informs the user.
+    """
+    games = Game.load_games()
+    if games:
+        lines = [
+            f"ID: {game['game_id']}, Title: {game['title']}, Price: ${game['price']}"
+            for game in games
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+    else:
+        print("No games available.")
+
+
+def show_machines():
+    """
+    Display all available arcade machines.
+
+    Loads machines from the Machine class and prints their details with
+    a single buffered write. If no machines are available, informs the
+    user.
+    """
+    machines = Machine.load_machines()
+    if machines:
+        lines = []
+        append = lines.append
+        for machine in machines:
+            append(
+                f"ID: {machine['machine_id']}, Type: {machine['type']}, Material: {machine['material']}, Color: {machine['color']}, Player Count: {machine['player_count']}"
+            )
+            append(
+                f"Dimensions: {machine['dimensions']}, Weight: {machine['weight']} kg, Power Consumption: {machine['power_consumption']} W"
+            )
+            append(
+                f"Processor: {machine['processor']}, Memory: {machine['memory']}, Base Price: ${machine['base_price']}"
+            )
+            append("---")
+        sys.stdout.write("\n".join(lines) + "\n")
+    else:
+        print("No machines available.")
+
+
+def buy_machine(users_by_id):
+    """
+    Facilitate the purchase of an arcade machine by a user.
+
+    Args:
+        users_by_id (dict): Index of user records keyed by their ID.
+
+    Prompts the user for their ID, address, and machine code. Allows them to modify
+    machine properties such as material and player count. Computes total price,
+    saves purchase details to 'purchases.json', and confirms purchase.
+    """
+    user_id = _read_int("Enter your user ID: ")
+
+    if user_id not in users_by_id:
+        print("User ID not found.")
+        return
+
+    address = input("Enter your address: ")
+
+    machine_code = input("Enter the machine code you want to buy: ")
+
+    machines = Machine.load_machines()
+    machines_by_id = {m["machine_id"]: m for m in machines}
+    machine = machines_by_id.get(machine_code)
+
+    if not machine:
+        print("Machine code not found.")
+        return
+
+    # Work on a copy: load_machines returns the cached catalog records,
+    # and this buyer's customizations must not leak into it.
+    machine = dict(machine)
+
+    material_change = (
+        input("Do you want to change the material? (yes/no): ").lower() == "yes"
+    )
+
+    if material_change:
+        new_material = input("Enter new material (wood/aluminum/carbon fiber): ")
+        machine["material"] = new_material
+
+    player_count = _read_int(
+        "Enter number of players (current is {}): ".format(machine["player_count"])
+    )
+    machine["player_count"] = player_count
+
+    color = input("Enter color (current is {}): ".format(machine["color"]))
+    machine["color"] = color
+
+    games_catalog = Game.load_games()
+    games_by_id = {g["game_id"]: g for g in games_catalog}
+
+    games_to_add = []
+    while True:
+        game_code = input("Enter game code to add (or type 'done' to finish): ")
+        if game_code.lower() == "done":
+            break
+
+        game = games_by_id.get(game_code)
+
+        if game:
+            games_to_add.append(game)
+            print(f"Added game: {game['title']}")
+        else:
+            print("Game code not found.")
+
+    total_price = machine["base_price"]
+    for game in games_to_add:
+        total_price += game["price"]
+
+    purchase_summary = {
+        "user_id": user_id,
+        "address": address,
+        "machine_code": machine_code,
+        "material": machine["material"],
+        "color": machine["color"],
+        "player_count": player_count,
+        "total_price": total_price,
+        "games_added": [game["title"] for game in games_to_add],
+        "purchase_date": _format_timestamp(int(time.time())),
+    }
+
+    _migrate_legacy_list("purchases.json", "purchases.jsonl")
+    _get_purchase_writer().submit(purchase_summary)
+
+    print(f"Purchase completed. Summary: {purchase_summary}")
+
+
+def _buy_machine_scripted(users_by_id, args):
+    """
+    Execute one scripted machine purchase without prompting.
+
+    Args:
+        users_by_id (dict): Index of user records keyed by their ID.
+        args (list): Command arguments: user_id, address, machine
+            code, material, color, player count, then zero or more
+            game codes.
+    """
+    user_id = int(args[0])
+    address, machine_code, material, color = args[1], args[2], args[3], args[4]
+    player_count = int(args[5])
+    game_codes = args[6:]
+
+    if user_id not in users_by_id:
+        print(f"User ID {user_id} not found.")
+        return
+
+    machines_by_id = {m["machine_id"]: m for m in Machine.load_machines()}
+    machine = machines_by_id.get(machine_code)
+    if not machine:
+        print(f"Machine code {machine_code} not found.")
+        return
+
+    games_by_id = {g["game_id"]: g for g in Game.load_games()}
+    games_to_add = []
+    for game_code in game_codes:
+        game = games_by_id.get(game_code)
+        if game:
+            games_to_add.append(game)
+        else:
+            print(f"Game code {game_code} not found.")
+
+    total_price = machine["base_price"]
+    for game in games_to_add:
+        total_price += game["price"]
+
+    purchase_summary = {
+        "user_id": user_id,
+        "address": address,
+        "machine_code": machine_code,
+        "material": material,
+        "color": color,
+        "player_count": player_count,
+        "total_price": total_price,
+        "games_added": [game["title"] for game in games_to_add],
+        "purchase_date": _format_timestamp(int(time.time())),
+    }
+
+    _get_purchase_writer().submit(purchase_summary)
+    print(f"Purchase completed. Summary: {purchase_summary}")
+
+
+def run_script(path):
+    """
+    Execute a command file in batch mode.
+
+    Args:
+        path (str): Path of the command file. Each line holds one
+            command ('create_user', 'show_games', 'show_machines',
+            'buy_machine', 'view_purchases'); arguments follow shell
+            quoting rules and '#' lines are comments.
+
+    All commands run against in-memory state, so nothing round-trips
+    through the terminal. A malformed line is reported and skipped
+    rather than aborting the batch. New users are collected and
+    appended with a single write, and queued purchases are flushed
+    once at the end, amortizing the file I/O across the whole script;
+    both writes happen even if a later command fails.
+    """
+    _migrate_legacy_list("users.json", "users.jsonl")
+    users = _load_records("users.jsonl")
+    users_by_id = {user["id"]: user for user in users}
+    new_user_records = []
+
+    with open(path, "r", encoding="utf-8") as file:
+        lines = [
+            line.strip()
+            for line in file
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+    try:
+        for line in lines:
+            try:
+                parts = shlex.split(line)
+            except ValueError as e:
+                print(f"Skipping '{line}': {e}")
+                continue
+            op, args = parts[0], parts[1:]
+            try:
+                if op == "create_user":
+                    record = _create_user_record(
+                        users, users_by_id, args[0], args[1]
+                    )
+                    new_user_records.append(record)
+                    print(f"User created with ID: {record['id']}")
+                elif op == "show_games":
+                    show_games()
+                elif op == "show_machines":
+                    show_machines()
+                elif op == "buy_machine":
+                    _buy_machine_scripted(users_by_id, args)
+                elif op == "view_purchases":
+                    view_purchases(int(args[0]))
+                else:
+                    print(f"Unknown command: {op}")
+            except ValueError as e:
+                print(f"Skipping '{' '.join(parts)}': {e}")
+            except IndexError:
+                print(f"Skipping '{' '.join(parts)}': missing arguments")
+    finally:
+        if new_user_records:
+            with open("users.jsonl", "ab", buffering=_BUFFER_SIZE) as file:
+                file.write(b"".join(_dumps_line(r) for r in new_user_records))
+        if _purchase_writer is not None:
+            _purchase_writer.flush()
+
+
+def view_purchases(user_id):
+    """
+   View all purchases made by a specific user.
+
+   Args:
+       user_id (int): The ID of the user whose purchases are to be viewed.
+
+   Looks the user up in the per-user offset index and seeks straight
+   to their records in 'purchases.jsonl', so the cost depends only on
+   how many purchases this user made, not on the total history. If no
+   purchases are found, informs the user.
+   """
+    _migrate_legacy_list("purchases.json", "purchases.jsonl")
+    if _purchase_writer is not None:
+        _purchase_writer.flush()
+    if not os.path.exists("purchases.jsonl"):
+        print("No purchases have been made yet.")
+        return
+
+    offsets = _sync_purchase_index().get(str(user_id))
+    if not offsets:
+        print("No purchases found for this ID.")
+        return
+
+    with open("purchases.jsonl", "rb", buffering=_BUFFER_SIZE) as file:
+        for offset in offsets:
+            file.seek(offset)
+            print(_loads(file.readline()))
+
+
+def main():
+    """
+   Main function that runs the command-line interface for managing arcade machines.
+
+   With '--script path' the command file is executed in batch mode
+   instead. Otherwise, loads existing users from 'users.jsonl'
+   (migrating a legacy 'users.json' on first use) and presents options
+   to create users, show games/machines, buy machines, or view
+   purchases. Runs until exit is chosen.
+   """
+    parser = argparse.ArgumentParser(description="Arcade machine store CLI.")
+    parser.add_argument(
+        "--script",
+        metavar="path",
+        help="run the commands in this file instead of the interactive menu",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="indent saved JSON files for human readers (default is compact)",
+    )
+    cli_args = parser.parse_args()
+
+    if cli_args.pretty:
+        set_pretty_output(True)
+
+    try:
+        if cli_args.script:
+            run_script(cli_args.script)
+            return
+
+        _migrate_legacy_list("users.json", "users.jsonl")
+        users = _load_records("users.jsonl")
+        users_by_id = {user["id"]: user for user in users}
+
+        menu = {
+            1: lambda: create_user(users, users_by_id),
+            2: show_games,
+            3: show_machines,
+            4: lambda: buy_machine(users_by_id),
+            5: lambda: view_purchases(
+                _read_int("Enter your user ID to view purchases: ")
+            ),
+        }
+
+        while True:
+            print(
+                "\n1. Create User\n2. Show Games\n3. Show Machines\n4. Buy Machine\n5. View Purchases\n6. Exit"
+            )
+            choice = _read_int("Choose an option: ")
+
+            if choice == 6:
+                break
+            action = menu.get(choice)
+            if action is None:
+                print("Invalid option. Please try again.")
+                continue
+            action()
+
+    except FileNotFoundError as e:
+        print(f"Error loading files: {e}")
+
+
+if __name__ == "__main__":
+    main()
